@@ -3,6 +3,9 @@ from urllib.parse import unquote
 from tortoise.models import Model
 from tortoise import fields
 from tortoise.queryset import QuerySet
+from tortoise.transactions import in_transaction
+from tortoise.signals import Signals
+from tortoise import timezone
 from robyn import Robyn, Request, Response, jsonify
 from robyn.templating import JinjaTemplate
 from pathlib import Path
@@ -11,9 +14,12 @@ import json
 from datetime import datetime
 from types import ModuleType
 from urllib.parse import parse_qs
-import traceback
 from dataclasses import dataclass
 import asyncio
+import base64
+import time
+import logging
+import orjson
 
 from ..models import AdminUser
 from .fields import (
@@ -27,9 +33,14 @@ from ..i18n.translations import get_text
 from .menu import MenuManager  # 确保导入 MenuManager
 from .inline import InlineModelAdmin
 
-from tortoise.expressions import Q
-import operator
-from functools import reduce
+from tortoise.expressions import Q, F
+from tortoise.contrib.postgres.fields import TSVectorField
+try:
+    from tortoise.contrib.postgres.search import SearchQuery, SearchRank
+except ImportError:  # 旧版本 Tortoise 没有 ts_rank 表达式，全文搜索结果不按相关度排序
+    SearchQuery = SearchRank = None
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class MenuItem:
@@ -40,6 +51,54 @@ class MenuItem:
     order: int = 0              # 排序值
     
 
+# 分页和排序参数不影响记录总数
+_PAGING_PARAMS = frozenset(('limit', 'offset', 'sort', 'order', 'cursor', 'exact_count'))
+_COUNT_CACHE_SIZE = 256
+_PROCESSED_FIELDS_CACHE_SIZE = 256
+
+
+def _copy_mutable(value: Any) -> Any:
+    """复制列表、字典、集合（包括嵌套的容器），其他对象原样返回"""
+    if isinstance(value, dict):
+        return {key: _copy_mutable(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_mutable(item) for item in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def _to_text(value: Any) -> str:
+    return '' if value is None else str(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _make_display_formatter(name: str, formatter: Callable) -> Callable:
+    """包装字段的 formatter，空值返回空字符串，格式化失败时回退为字符串"""
+    if asyncio.iscoroutinefunction(formatter):
+        async def display(value):
+            if value is None:
+                return ''
+            try:
+                return await formatter(value)
+            except Exception as e:
+                logger.warning("Error formatting field %s: %s", name, e)
+                return str(value)
+    else:
+        def display(value):
+            if value is None:
+                return ''
+            try:
+                return formatter(value)
+            except Exception as e:
+                logger.warning("Error formatting field %s: %s", name, e)
+                return str(value)
+    return display
+
+
 def trace_method(func):
     def wrapper(*args, **kwargs):
         result = func(*args, **kwargs)
@@ -55,16 +114,72 @@ class ModelAdmin:
     menu_icon: bootstrap icon class
 
     menu_order: int 排序位置  
+
+    requires_instance: 列表数据是否需要完整的模型实例，默认直接查询字典以减少模型构造开销；
+        table_fields 中包含 @property 等非数据库字段时会自动查询完整实例
+
+    list_select_related: 列表查询时 JOIN 加载的外键关系，如 ('author',)
+
+    list_prefetch_related: 列表查询时批量预取的关系（多对多、反向外键），如 ('tags',)；
+        table_fields 中配置了 formatter 的多对多、反向外键字段会自动预取
+
+    list_full_rows: 查询模型实例时是否加载全部字段，默认只查询列表显示需要的字段
+
+    search_vector_field: PostgreSQL 下用于全文搜索的 TSVectorField 字段名，设置后关键字搜索使用
+        全文索引代替多个字段的 LIKE 查询，需要自行创建索引，如
+        CREATE INDEX ... USING GIN(search_tsv)；有搜索关键字且未指定排序列时按 ts_rank 相关度降序排列。
+        其他数据库仍使用 search_fields
+
+    列表数据接口传入 cursor 参数时使用游标分页：按 (排序字段, 主键) 从上一页最后一行之后继续查询，
+    不使用 OFFSET，深分页的代价与第一页相同。第一页传空的 cursor，之后传上一次返回的 next_cursor。
+    排序字段必须是列表查询的模型字段且不为空，未指定时只按主键排序；大表需要建立 (排序字段, 主键) 联合索引
     """
     
     
     # 添加内联配置
     inlines: List[Type[InlineModelAdmin]] = []
+
+    # 列表页默认使用 values() 查询，序列化需要模型实例时设置为 True
+    requires_instance: bool = False
+
+    # formatter 需要访问关联对象时声明，列表查询一次性加载，避免逐行查询
+    list_select_related: tuple = ()
+    list_prefetch_related: tuple = ()
+
+    # 自定义序列化需要访问未显示的字段时设置为 True
+    list_full_rows: bool = False
+
+    search_vector_field: Optional[str] = None
+
+    # 列表总数缓存时间（秒），默认 0 表示每次都执行 COUNT 查询。缓存保存在当前进程的管理类实例中，
+    # 只有通过本后台的增删改会清空；其他进程或代码直接写库后，总数最多会滞后 count_cache_ttl 秒
+    count_cache_ttl: float = 0
+
+    # PostgreSQL 下没有搜索和过滤条件时，是否使用 pg_class.reltuples 估算总数代替 COUNT(*)
+    estimate_count: bool = False
+
+    # 批量添加时每条 INSERT 语句包含的最大行数
+    bulk_create_batch_size: int = 500
+
+    # 批量删除时每条 DELETE ... IN 语句包含的最大主键数量，避免超过数据库的参数个数限制（如 SQLite 999）
+    batch_delete_chunk_size: int = 500
+
+    # 自定义 handle_delete 时，批量删除同时执行的单条删除数量上限
+    batch_delete_concurrency: int = 10
+
+    # 自定义 handle_delete 时，是否在同一事务中依次执行批量删除（只提交一次，但不能并发）
+    batch_delete_atomic: bool = False
+
+    # (管理类, 模型) -> _process_fields 生成的属性，每个实例取出的是容器的副本
+    _processed_fields_cache: Dict[tuple, dict] = {}
     
     def __init__(self, model: Type[Model]):
 
         self.model = model
         self.is_inline = False  # 添加标识
+        # 模型元数据在运行期不会变化，绑定到实例上减少属性链查找
+        self._fields_map = model._meta.fields_map
+        self._pk_attr = model._meta.pk_attr
         
         # 确保基本属性被设置
         self.verbose_name = getattr(self, 'verbose_name', model.__name__)
@@ -94,24 +209,62 @@ class ModelAdmin:
         if not hasattr(self, 'menu_group') or not self.menu_group:
             self.menu_group = "系统管理"
             
-        self._process_fields()
+        self._load_processed_fields()
         
+        # 列表总数缓存 {过滤条件: (缓存时间, 总数)}
+        self._count_cache: Dict[tuple, tuple] = {}
+
+        # 过滤字段未动态获取时，列表查询可以按请求参数名直接查找过滤字段
+        self._static_filter_fields = (
+            type(self).get_filter_fields is ModelAdmin.get_filter_fields
+        )
+
+        # 前端配置缓存，表单、搜索、过滤字段可以动态获取时不缓存
+        self._frontend_config: Optional[dict] = None
+        self._frontend_config_cacheable = all(
+            getattr(type(self), name) is getattr(ModelAdmin, name)
+            for name in ('get_form_fields', 'get_add_form_fields',
+                         'get_filter_fields', 'get_search_fields')
+        )
+
         # 初始化内联管理类
         self._inline_instances = [
             inline_class(self.model) for inline_class in self.inlines
         ]
+        # 内联模型名 -> 内联管理实例
+        self._inline_by_model = {inline.model.__name__: inline for inline in self._inline_instances}
+        # 列表页内联配置缓存
+        self._list_inlines: Optional[list] = None
     
+    def _load_processed_fields(self):
+        """字段配置只依赖管理类和模型，同一组合只处理一次，之后直接复用结果"""
+        cache_key = (type(self), self.model)
+        cached = ModelAdmin._processed_fields_cache.get(cache_key)
+        if cached is None:
+            before = dict(self.__dict__)
+            self._process_fields()
+            cached = {
+                key: _copy_mutable(value) for key, value in self.__dict__.items()
+                if key not in before or before[key] is not value
+            }
+            if len(ModelAdmin._processed_fields_cache) >= _PROCESSED_FIELDS_CACHE_SIZE:
+                ModelAdmin._processed_fields_cache.clear()
+            ModelAdmin._processed_fields_cache[cache_key] = cached
+        else:
+            # 复制列表、字典等可变属性，实例修改自己的配置时不影响其他实例
+            self.__dict__.update({key: _copy_mutable(value) for key, value in cached.items()})
+
     def _process_fields(self):
         """处理字段配置，生成便捷属性"""
         # if not init for table_fields, auto create table_fields from model
         if not self.table_fields:
             self.table_fields = [
                 TableField(name=field_name)
-                for field_name in self.model._meta.fields_map.keys()
+                for field_name in self._fields_map.keys()
             ]
         # process table field display config
         for field in self.table_fields:
-            model_field = self.model._meta.fields_map.get(field.name)
+            model_field = self._fields_map.get(field.name)
             if model_field and model_field.pk:
                 field.readonly = True
                 field.editable = False
@@ -126,6 +279,8 @@ class ModelAdmin:
         
         # create table field map
         self.table_field_map = {field.name: field for field in self.table_fields}
+        self.filter_field_map = {field.name: field for field in self.filter_fields}
+        self.search_field_map = {field.name: field for field in self.search_fields}
             
         # if not init for form_fields, create form_fields from table_fields
         if not self.form_fields:
@@ -176,8 +331,230 @@ class ModelAdmin:
         # 如果没有定义add_form_fields，使用form_fields
         if not self.add_form_fields:
             self.add_form_fields = self.form_fields
-        
-        
+        # 提交表单时按字段名直接查找表单字段
+        self.form_field_map = {field.name: field for field in self.form_fields}
+        self.add_form_field_map = {field.name: field for field in self.add_form_fields}
+        # 编辑时可以直接 UPDATE 的字段（不含主键的数据库字段），以及需要手动刷新的 auto_now 字段
+        self._direct_update_fields = frozenset(
+            self.model._meta.fields_db_projection.keys() - {self._pk_attr}
+        )
+        self._auto_now_fields = tuple(
+            name for name, field in self._fields_map.items() if getattr(field, 'auto_now', False)
+        )
+
+        self._build_serializers()
+
+        # 表格字段和内联配置是固定的元数据，前端配置直接复用
+        self._frontend_schema = {
+            "tableFields": [field.to_dict() for field in self.table_fields],
+            "inlines": [
+                {
+                    "model": inline.model.__name__,
+                    "fields": [field.to_dict() for field in inline.table_fields],
+                    "title": getattr(inline.model.Meta, 'description', inline.verbose_name)
+                }
+                for inline in getattr(self, 'inlines', [])
+            ]
+        }
+
+        # 搜索字段按是否需要查询关联模型分组
+        self._direct_search_keys = tuple(
+            field.name for field in self.search_fields
+            if not (field.related_model and field.related_key)
+        )
+        self._related_search_fields = tuple(
+            field for field in self.search_fields
+            if field.related_model and field.related_key
+        )
+
+        # 外键、布尔字段集合，过滤选项直接查集合判断
+        meta = self.model._meta
+        fk_names = set()
+        for name in meta.fk_fields | meta.o2o_fields:
+            fk_names.add(name)
+            source_field = getattr(self._fields_map[name], 'source_field', None)
+            fk_names.add(source_field or f"{name}_id")
+        self._fk_field_names = frozenset(fk_names)
+        self._bool_field_names = frozenset(
+            name for name, field in self._fields_map.items()
+            if isinstance(field, fields.BooleanField)
+        )
+
+        # 过滤选项只依赖类配置和模型元数据，初始化时计算一次
+        self._filter_choices = {
+            name: self._build_filter_choices(name) for name in self.list_filter
+        }
+
+    def _build_serializers(self):
+        """预先确定每个字段的序列化方式，避免逐行重复判断"""
+        if self.search_vector_field and not isinstance(
+            self._fields_map.get(self.search_vector_field), TSVectorField
+        ):
+            # 普通文本列上的 __search 会逐行执行 to_tsvector，无法使用索引
+            raise ValueError(f"search_vector_field 必须是 TSVectorField: {self.search_vector_field}")
+        plain_names = []
+        related_fields = []
+        raw_fmt = {}
+        display_fmt = {}
+        async_display_fields = set()
+        for field in self.table_fields:
+            is_switch = field.display_type == DisplayType.SWITCH
+            if field.related_model and field.related_key and not is_switch:
+                related_fields.append(field)
+                continue
+            plain_names.append(field.name)
+            if is_switch:
+                # switch 字段保留原始值，由前端判断开关状态
+                raw_fmt[field.name] = display_fmt[field.name] = _identity
+            else:
+                raw_fmt[field.name] = _to_text
+                if field.formatter:
+                    display_fmt[field.name] = _make_display_formatter(field.name, field.formatter)
+                    if asyncio.iscoroutinefunction(field.formatter):
+                        async_display_fields.add(field.name)
+                else:
+                    display_fmt[field.name] = _to_text
+        plain_names = tuple(plain_names)
+        self._plain_field_names = plain_names
+        # 显示值与原始值不同的字段（配置了 formatter 的普通字段）
+        self._formatted_field_names = tuple(
+            name for name in plain_names if display_fmt[name] is not raw_fmt[name]
+        )
+        self._related_table_fields = tuple(related_fields)
+        self._raw_fmt = raw_fmt
+        self._display_fmt = display_fmt
+        self._async_display_fields = frozenset(async_display_fields)
+        # 序列化计划：(字段名, 原始值格式化, 显示值格式化, 是否异步)，热循环直接解包
+        self._serialize_plan = tuple(
+            (name, raw_fmt[name], display_fmt[name], name in async_display_fields)
+            for name in plain_names
+        )
+        raw_plan = tuple((name, raw_fmt[name]) for name in plain_names)
+
+        # 列表查询只取序列化需要的数据库字段
+        db_fields = self.model._meta.fields_db_projection
+        columns = [self._pk_attr]
+        names = list(plain_names) + [field.related_key for field in related_fields]
+        for name in names:
+            if name in db_fields and name not in columns:
+                columns.append(name)
+        self._select_columns = tuple(columns)
+
+        # related_key 对应模型外键时，关联字段的显示值通过 JOIN 一次取出，避免逐行查询
+        fk_by_source = {}
+        for rel_name in self.model._meta.fk_fields | self.model._meta.o2o_fields:
+            fk_field = self._fields_map[rel_name]
+            fk_by_source[getattr(fk_field, 'source_field', None) or f"{rel_name}_id"] = fk_field
+        joined = {}
+        select_aliases = {}
+        select_related = []
+        for field in related_fields:
+            fk_field = fk_by_source.get(field.related_key)
+            if fk_field is None or fk_field.related_model is not field.related_model:
+                continue
+            related_attr = self._related_attr(field)
+            joined[field.name] = (fk_field.model_field_name, related_attr)
+            if field.name not in self._fields_map:
+                select_aliases[field.name] = f"{fk_field.model_field_name}__{related_attr}"
+            if fk_field.model_field_name not in select_related:
+                select_related.append(fk_field.model_field_name)
+        self._joined_related = joined
+        # 排序计划：列名 -> order_by 使用的字段路径；通过 JOIN 显示的关联列按关联字段排序
+        sort_plan = {name: name for name in db_fields}
+        for name, (rel_name, related_attr) in joined.items():
+            sort_plan.setdefault(name, f"{rel_name}__{related_attr}")
+        self._sort_plan = sort_plan
+        # 关联字段要显示的属性名，如 AdminUser_username -> username
+        self._related_attrs = {field.name: self._related_attr(field) for field in related_fields}
+        # 模型实例中没有通过 select_related 加载的关联字段
+        self._lookup_related_fields = tuple(
+            field for field in related_fields if field.name not in joined
+        )
+        self._select_aliases = select_aliases
+        # values() 结果的序列化计划：JOIN 取到的关联字段与普通字段一样直接格式化，
+        # 剩余无法 JOIN 的关联字段才逐行查询
+        self._values_plan = self._serialize_plan + tuple(
+            (name, _to_text, _to_text, False) for name in select_aliases
+        )
+        self._values_related_fields = tuple(
+            field for field in related_fields if field.name not in select_aliases
+        )
+
+        for name in self.list_select_related:
+            if name not in select_related:
+                select_related.append(name)
+        self._select_related = tuple(select_related)
+        # 配置了 formatter 的多对多、反向关系字段批量预取，避免 formatter 访问时逐行查询；
+        # 没有 formatter 的关系字段只会显示对象描述，不为它们加载关联数据
+        meta = self.model._meta
+        many_fields = meta.m2m_fields | meta.backward_fk_fields | meta.backward_o2o_fields
+        prefetch_related = [
+            field.name for field in self.table_fields
+            if field.name in many_fields and field.formatter and field.name in plain_names
+        ]
+        for name in self.list_prefetch_related:
+            if name not in prefetch_related:
+                prefetch_related.append(name)
+        self._prefetch_related = tuple(prefetch_related)
+        # 显示 @property 等非数据库字段时，values() 取不到值，这些属性可能依赖任意列，需要完整实例
+        self._has_computed_fields = any(
+            name not in db_fields and name not in many_fields for name in plain_names
+        )
+        # 需要加载关系或计算属性时，列表必须查询模型实例
+        self._fetch_instances = bool(
+            self.requires_instance or self.list_select_related or prefetch_related
+            or self._has_computed_fields
+        )
+
+        def form_serializer(obj: Union[Model, dict]) -> dict:
+            get = dict.get if isinstance(obj, dict) else getattr
+            return {name: fmt(get(obj, name, None)) for name, fmt in raw_plan}
+
+        self._form_serializer = form_serializer
+
+    async def _get_related_values(self, obj: Union[Model, dict], related_fields) -> Dict[str, str]:
+        """并发获取一个对象的多个关联字段显示值，返回 {字段名: 显示值}"""
+        if not related_fields:
+            return {}
+        if len(related_fields) == 1:
+            field = related_fields[0]
+            return {field.name: await self._get_related_value(obj, field)}
+        values = await asyncio.gather(
+            *(self._get_related_value(obj, field) for field in related_fields)
+        )
+        return {field.name: value for field, value in zip(related_fields, values)}
+
+    @staticmethod
+    def _related_attr(field: TableField) -> str:
+        """从字段名中解析要显示的关联字段，如 AdminUser_username -> username"""
+        prefix = field.related_model.__name__ + '_'
+        if field.name.startswith(prefix):
+            return field.name[len(prefix):]
+        return 'id'
+
+    async def _get_related_value(self, obj: Union[Model, dict], field: TableField) -> str:
+        """获取关联字段的显示值"""
+        try:
+            is_dict = isinstance(obj, dict)
+            joined = self._joined_related.get(field.name)
+            if joined is not None:
+                # 已经通过 JOIN 取到的值直接使用
+                if is_dict and field.name in obj:
+                    return _to_text(obj[field.name])
+                if not is_dict:
+                    related_obj = getattr(obj, joined[0], None)
+                    if isinstance(related_obj, Model):
+                        return _to_text(getattr(related_obj, joined[1], None))
+            get = dict.get if is_dict else getattr
+            fk_value = get(obj, field.related_key, None)
+            if not fk_value:
+                return ''
+            related_obj = await field.related_model.get(id=fk_value)
+            related_value = getattr(related_obj, self._related_attrs[field.name])
+            return str(related_value) if related_value is not None else ''
+        except Exception:
+            return ''
+
     def get_field(self, field_name: str) -> Optional[TableField]:
         """获取字段配置"""
         return self.table_field_map.get(field_name)
@@ -185,22 +562,39 @@ class ModelAdmin:
     async def get_queryset(self, request: Request, params: dict) -> QuerySet:
         """geting tortoise queryset"""
         queryset = self.model.all()
+        if not params or not any(
+            value for key, value in params.items() if key not in _PAGING_PARAMS
+        ):
+            # 没有搜索和过滤条件时（如首次打开列表页）无需继续处理，排序和分页由调用方处理
+            return queryset
         # 这里需要对params里面的数据进行url解码, params是dict类型
         for key, value in params.items():
             if isinstance(value, str):
                 params[key] = unquote(value)
+        # 收集外键、搜索和过滤器的所有条件，最后只调用一次 filter，避免重复克隆查询集
+        filter_q = []
+        filter_kwargs = {}
         # 处理外键过滤 - 从内联配置中获取外键字段名
         for inline in self._inline_instances:
             if inline.model == self.model:  # 如果当前模型是内联模型
                 parent_id = params.get(inline.fk_field)  # 使用配置的外键字段名
                 if parent_id:
-                    queryset = queryset.filter(**{f"{inline.fk_field}_id": parent_id})
+                    filter_kwargs[f"{inline.fk_field}_id"] = parent_id
                     break
         # 处理搜索
         search = params.get('search', '')
-        if search and self.search_fields:
-            search_conditions = []
-            for field in self.search_fields:
+        if search and self.search_vector_field and self._is_postgres():
+            # 使用全文索引搜索，避免逐列 LIKE 全表扫描
+            filter_kwargs[f"{self.search_vector_field}__search"] = search
+            if SearchRank is not None:
+                # 相关度供 _get_ordered_queryset 在未指定排序列时使用
+                queryset = queryset.annotate(
+                    _search_rank=SearchRank(F(self.search_vector_field), SearchQuery(search))
+                )
+        elif search and self.search_fields:
+            # 普通字段直接按预先生成的查询键构建条件，只有关联字段需要先查询关联模型
+            search_conditions = [Q(**{key: search}) for key in self._direct_search_keys]
+            for field in self._related_search_fields:
                 try:
                     # 使用 SearchField 的 build_search_query 方法构建查询
                     query_dict = await field.build_search_query(search)
@@ -212,15 +606,18 @@ class ModelAdmin:
                         else:
                             search_conditions.append(Q(**query_dict))
                 except Exception as e:
-                    print(f"Error building search query for {field.name}: {str(e)}")
+                    logger.warning("Error building search query for %s: %s", field.name, e)
                     continue
                 
             if search_conditions:
-                combined_q = reduce(operator.or_, search_conditions)
-                queryset = queryset.filter(combined_q)
+                filter_q.append(Q(*search_conditions, join_type=Q.OR))
         
-        # 处理过滤器
-        filter_fields = await self.get_filter_fields()
+        # 处理过滤器：未重写 get_filter_fields 时只处理请求中出现的过滤字段
+        if self._static_filter_fields:
+            filter_field_map = self.filter_field_map
+            filter_fields = [filter_field_map[name] for name in params.keys() & filter_field_map.keys()]
+        else:
+            filter_fields = await self.get_filter_fields()
         for filter_field in filter_fields:
             filter_value = params.get(filter_field.name)
             if filter_value:
@@ -230,20 +627,27 @@ class ModelAdmin:
                         if len(query_dict) == 1 and "id" in query_dict and query_dict["id"] is None:
                             continue
                         if "_q_object" in query_dict:
-                            # 如果是Q对象，直接使用filter
-                            queryset = queryset.filter(query_dict["_q_object"])
+                            filter_q.append(query_dict["_q_object"])
                         else:
-                            # 否则使用关键字参数
-                            queryset = queryset.filter(**query_dict)
+                            filter_kwargs.update(query_dict)
                 except Exception as e:
-                    print(f"Error building filter query for {filter_field.name}: {str(e)}")
+                    logger.warning("Error building filter query for %s: %s", filter_field.name, e)
                     continue
+        if filter_q or filter_kwargs:
+            queryset = queryset.filter(*filter_q, **filter_kwargs)
         return queryset
         
+    def _is_postgres(self) -> bool:
+        """当前模型所在数据库是否为 PostgreSQL"""
+        try:
+            return self.model._meta.db.capabilities.dialect == "postgres"
+        except Exception:
+            return False
+
     def get_field_label(self, field_name: str) -> str:
-        for field in self.table_fields:
-            if field.name == field_name and field.label:
-                return field.label
+        field = self.table_field_map.get(field_name)
+        if field and field.label:
+            return field.label
         return field_name.replace('_', ' ').title()
         
     def get_list_display_links(self) -> List[str]:
@@ -254,32 +658,36 @@ class ModelAdmin:
         return ['id']
         
     def is_field_editable(self, field_name: str) -> bool:
-        for field in self.table_fields:
-            if field.name == field_name:
-                return field.editable and not field.readonly
+        field = self.table_field_map.get(field_name)
+        if field:
+            return field.editable and not field.readonly
         return False
 
     def get_filter_choices(self, field_name: str) -> List[tuple]:
-        # 从 filter_fields 中获取选
-        for field in self.filter_fields:
-            if field.name == field_name:
-                if field.choices:
-                    return [(str(k), v) for k, v in field.choices.items()]
-                break
+        choices = self._filter_choices.get(field_name)
+        if choices is None:
+            # 不在 list_filter 中的字段首次请求时计算并缓存
+            choices = self._filter_choices[field_name] = self._build_filter_choices(field_name)
+        return choices
+
+    def _build_filter_choices(self, field_name: str) -> List[tuple]:
+        # 从 filter_fields 中获取选项
+        field = self.filter_field_map.get(field_name)
+        if field and field.choices:
+            return [(str(k), v) for k, v in field.choices.items()]
             
         # 处理布尔字段
-        model_field = self.model._meta.fields_map.get(field_name)
-        if isinstance(model_field, fields.BooleanField):
+        if field_name in self._bool_field_names:
             return [('True', '是'), ('False', '否')]
             
         # 如果是外键字段，返回空列表（后续可以异步获取选项）
-        if field_name.endswith('_id') and isinstance(model_field, fields.IntField):
+        if field_name in self._fk_field_names:
             return []
             
         return []
         
     async def get_object(self, pk):
-        return await self.model.get(id=pk)
+        return await self.model.get(**{self._pk_attr: pk})
         
     def get_form_fields(self) -> List[str]:
         return [
@@ -291,71 +699,177 @@ class ModelAdmin:
         return self.list_display or [field.name for field in self.table_fields]
 
     def format_field_value(self, obj: Model, field_name: str) -> str:
-        field = self.get_field(field_name)
+        value = getattr(obj, field_name, '')
+        field = self.table_field_map.get(field_name)
         if not field:
-            return str(getattr(obj, field_name, ''))
-        return field.format_value(getattr(obj, field_name, ''))
+            return str(value)
+        return field.format_value(value)
+
+    async def fetch_objects(self, queryset: QuerySet) -> List[Union[Model, dict]]:
+        """执行列表查询：只读列表取字典，需要实例时预取外键关联"""
+        if self._fetch_instances:
+            if self._select_related:
+                queryset = queryset.select_related(*self._select_related)
+            elif not (self.list_full_rows or self._has_computed_fields):
+                # 只构造列表需要的字段，宽表可显著减少传输和实例化开销
+                queryset = queryset.only(*self._select_columns)
+            if self._prefetch_related:
+                queryset = queryset.prefetch_related(*self._prefetch_related)
+            return await queryset
+        return await queryset.values(*self._select_columns, **self._select_aliases)
+
+    def _serialize_plan_for(self, obj: Union[Model, dict]) -> tuple:
+        """根据对象类型返回 (取值函数, 序列化计划, 需逐行查询的关联字段)"""
+        if isinstance(obj, dict):
+            return dict.get, self._values_plan, self._values_related_fields
+        return getattr, self._serialize_plan, self._related_table_fields
 
-    async def serialize_object(self, obj: Model, for_display: bool = True) -> dict:
-        """序列化对象"""
+    async def serialize_object(self, obj: Union[Model, dict], for_display: bool = True) -> dict:
+        """序列化对象，obj 可以是模型实例或 values() 返回的字典"""
+        if not for_display:
+            # 表单数据不需要格式化，直接使用预先生成的序列化函数
+            result = self._form_serializer(obj)
+            result.update(await self._get_related_values(obj, self._related_table_fields))
+            return result
+
+        get, plan, related_fields = self._serialize_plan_for(obj)
         result = {}
-        fields_to_serialize = self.table_fields
-        for field in fields_to_serialize:
-            try:
-                # 获取字段值
-                value = getattr(obj, field.name, None)
-                
-                # 处理 switch 类型字段
-                if field.display_type == DisplayType.SWITCH:
-                    result[field.name] = value
-                    continue
-                
-                # 处理关联字段
-                if field.related_model and field.related_key:
-                    try:
-                        # 获取外键值
-                        fk_value = getattr(obj, field.related_key)
-                        if fk_value:
-                            # 查询关联对象
-                            related_obj = await field.related_model.get(id=fk_value)
-                            if related_obj:
-                                # 从字段名中解析要显示的关联字段
-                                model_name = field.related_model.__name__
-                                if field.name.startswith(model_name + '_'):
-                                    # 移除模型名称前缀，获取实际字段名
-                                    related_field = field.name[len(model_name + '_'):]
-                                else:
-                                    # 如果字段名不符合预期格式，使用默认字段
-                                    related_field = 'id'
-                                # 获取关联字段的值
-                                related_value = getattr(related_obj, related_field)
-                                result[field.name] = str(related_value) if related_value is not None else ''
-                                continue
-                    except Exception as e:
-                        result[field.name] = ''
-                        continue
-                
-                # 处理普通字段
-                if for_display and field.formatter and value is not None:
-                    try:
-                        if asyncio.iscoroutinefunction(field.formatter):
-                            result[field.name] = await field.formatter(value)
-                        else:
-                            result[field.name] = field.formatter(value)
-                    except Exception as e:
-                        print(f"Error formatting field {field.name}: {str(e)}")
-                        result[field.name] = str(value) if value is not None else ''
-                else:
-                    result[field.name] = str(value) if value is not None else ''
-                
-            except Exception as e:
-                print(f"Error serializing field {field.name}: {str(e)}")
-                result[field.name] = ''
-                
+        for name, _, display_fmt, is_async in plan:
+            value = display_fmt(get(obj, name, None))
+            if is_async:
+                value = await value
+            result[name] = value
+        result.update(await self._get_related_values(obj, related_fields))
         return result
 
+    async def serialize_object_both(self, obj: Union[Model, dict]) -> dict:
+        """一次遍历同时生成显示数据和原始数据，返回 {"display": ..., "data": ...}"""
+        display, data = await self.serialize_object_pair(obj)
+        return {"display": display, "data": data}
+
+    async def serialize_object_pair(
+        self, obj: Union[Model, dict], related_values: Optional[Dict[str, dict]] = None
+    ) -> tuple[dict, dict]:
+        """一次遍历同时生成显示数据和原始数据，返回 (display, data)
+
+        related_values 为 _prefetch_related_values 批量查询的关联显示值，命中时不再逐行查询
+        """
+        get, plan, related_fields = self._serialize_plan_for(obj)
+        display = {}
+        data = {}
+        for name, raw_fmt, display_fmt, is_async in plan:
+            value = get(obj, name, None)
+            data[name] = raw_fmt(value)
+            shown = display_fmt(value)
+            if is_async:
+                shown = await shown
+            display[name] = shown
+        pending = []
+        for field in related_fields:
+            name = field.name
+            prefetched = related_values.get(name) if related_values else None
+            if prefetched is not None:
+                display[name] = data[name] = prefetched.get(get(obj, field.related_key, None), '')
+            else:
+                pending.append(field)
+        if pending:
+            for name, value in (await self._get_related_values(obj, pending)).items():
+                display[name] = data[name] = value
+        return display, data
+
+    async def _prefetch_related_values(self, objects: list) -> Dict[str, dict]:
+        """批量查询一页数据中需要逐行查询的关联字段，返回 {字段名: {外键值: 显示值}}"""
+        if not objects:
+            return {}
+        if isinstance(objects[0], dict):
+            get, fields = dict.get, self._values_related_fields
+        else:
+            get, fields = getattr, self._lookup_related_fields
+        if not fields:
+            return {}
+
+        # 按关联模型汇总外键值，每个关联模型只查询一次
+        related_attrs = self._related_attrs
+        ids_by_model: Dict[Type[Model], set] = {}
+        columns_by_model: Dict[Type[Model], set] = {}
+        for field in fields:
+            ids = ids_by_model.setdefault(field.related_model, set())
+            columns_by_model.setdefault(field.related_model, {'id'}).add(related_attrs[field.name])
+            related_key = field.related_key
+            for obj in objects:
+                fk_value = get(obj, related_key, None)
+                if fk_value:
+                    ids.add(fk_value)
+
+        def query(model: Type[Model]) -> QuerySet:
+            queryset = model.filter(id__in=list(ids_by_model[model]))
+            columns = columns_by_model[model]
+            # 只取需要显示的字段；要显示的不是数据库字段（如 property）时查询完整对象
+            if columns <= model._meta.fields_db_projection.keys():
+                queryset = queryset.only(*columns)
+            return queryset
+
+        # 各关联模型的查询互不依赖，并发执行
+        models = [model for model, ids in ids_by_model.items() if ids]
+        results = await asyncio.gather(*(query(model) for model in models))
+        related_objects = {model: {} for model in ids_by_model}
+        for model, rows in zip(models, results):
+            related_objects[model] = {obj.id: obj for obj in rows}
+
+        return {
+            field.name: {
+                fk_value: _to_text(getattr(related_obj, related_attrs[field.name], None))
+                for fk_value, related_obj in related_objects[field.related_model].items()
+            }
+            for field in fields
+        }
+
+    async def serialize_pairs(self, objects: list) -> List[tuple]:
+        """批量序列化，返回 [(display, data), ...]，关联字段批量查询"""
+        related_values = await self._prefetch_related_values(objects)
+        if self._async_display_fields:
+            # 有异步 formatter 时各行的等待互相重叠
+            return list(await asyncio.gather(
+                *(self.serialize_object_pair(obj, related_values) for obj in objects)
+            ))
+        return [await self.serialize_object_pair(obj, related_values) for obj in objects]
+
+    async def serialize_page(self, objects: list) -> List[dict]:
+        """序列化一页列表数据，关联字段批量查询，跳过序列化失败的行"""
+        related_values = await self._prefetch_related_values(objects)
+        if self._async_display_fields:
+            # 有异步 formatter 时各行并发序列化；纯同步的行逐个处理，避免创建任务的开销
+            rows = await asyncio.gather(
+                *(self.serialize_row(obj, related_values) for obj in objects)
+            )
+        else:
+            rows = [await self.serialize_row(obj, related_values) for obj in objects]
+        return [row for row in rows if row is not None]
+
+    async def serialize_row(
+        self, obj: Union[Model, dict], related_values: Optional[Dict[str, dict]] = None
+    ) -> Optional[dict]:
+        """序列化列表中的一行，display 只保留与 data 不同的字段；出错时记录日志并返回 None"""
+        try:
+            display, data = await self.serialize_object_pair(obj, related_values)
+        except Exception as e:
+            pk = obj.get(self._pk_attr) if isinstance(obj, dict) else obj.pk
+            logger.error("Error serializing object %s: %s", pk, e)
+            return None
+        return {
+            "data": data,
+            "display": {name: display[name] for name in self._formatted_field_names}
+        }
+
     async def process_form_data(self, data):
         """处理表单数据"""
+        if type(self).get_add_form_fields is ModelAdmin.get_add_form_fields:
+            # 表单字段固定时只处理提交的字段，每个字段一次字典查找
+            field_map = self.add_form_field_map
+            return {
+                name: field_map[name].process_value(value)
+                for name, value in data.items() if name in field_map
+            }
         processed_data = {}
         form_filds = await self.get_add_form_fields()
         for field in form_filds:
@@ -387,13 +901,15 @@ class ModelAdmin:
 
     @trace_method
     async def get_frontend_config(self) -> dict:
-        """获取前端配置"""
+        """获取前端配置，返回的字典可以由调用方添加键（如 language）"""
+        if self._frontend_config is not None:
+            return dict(self._frontend_config)
         form_fields = await self.get_form_fields()
         add_form_fields = await self.get_add_form_fields()
         filter_fields = await self.get_filter_fields()
         search_fields = await self.get_search_fields()
         config = {
-            "tableFields": [field.to_dict() for field in self.table_fields],
+            "tableFields": self._frontend_schema["tableFields"],
             "modelName": self.model.__name__,
             "route_id": self.route_id,
             "pageSize": self.per_page,
@@ -411,16 +927,11 @@ class ModelAdmin:
             "import_fields": self.import_fields,
             "verbose_name": self.verbose_name,
             "is_inline": self.is_inline,
-            "inlines": [
-                {
-                    "model": inline.model.__name__,
-                    "fields": [field.to_dict() for field in inline.table_fields],
-                    "title": getattr(inline.model.Meta, 'description', inline.verbose_name)
-                }
-                for inline in getattr(self, 'inlines', [])
-            ]
+            "inlines": self._frontend_schema["inlines"]
         }
-        
+        if self._frontend_config_cacheable:
+            self._frontend_config = config
+            return dict(config)
         return config
 
     async def get_inline_formsets(self, instance=None):
@@ -442,32 +953,21 @@ class ModelAdmin:
         """获取内联数据"""
         try:
             # 找到对应的内联实例
-            inline = next((i for i in self._inline_instances if i.model.__name__ == inline_model), None)
+            inline = self._inline_by_model.get(inline_model)
             if not inline:
                 return []
             # 获取父实例
-            parent_instance = await self.model.get(id=parent_id)
+            parent_instance = await self.model.get(**{self._pk_attr: parent_id})
             if not parent_instance:
                 return []
-            # 获取关联单记录
+            # 获取关联单记录，使用内联模型的批量序列化方法
             queryset = await inline.get_queryset(parent_instance)
-            data = []
-            async for obj in queryset:
-                try:
-                    # 使用内联模型的序列化方法
-                    serialized = await inline.serialize_object(obj)
-                    data.append({
-                        'data': serialized,
-                        'display': serialized
-                    })
-                except Exception as e:
-                    print(f"Error serializing object: {str(e)}")
-                    traceback.print_exc()
-                    continue
-            return data
+            return [
+                {'data': serialized, 'display': serialized}
+                for serialized in await inline.serialize_objects(await queryset)
+            ]
         except Exception as e:
-            print(f"Error in get_inline_data: {str(e)}")
-            traceback.print_exc()
+            logger.exception("Error in get_inline_data: %s", e)
             return []
 
     async def get_list_config(self) -> dict:
@@ -475,18 +975,20 @@ class ModelAdmin:
         # 获取基础配置
         config = await self.get_frontend_config()
         
-        # 只在列表页面添加内联配置
-        inlines = []
-        for inline in self._inline_instances:
-            inline_config = inline.get_formset()
-            # 从 Meta 类或模型名称获取标题
-            if hasattr(inline.model, 'Meta') and hasattr(inline.model.Meta, 'description'):
-                inline_config['title'] = inline.model.Meta.description
-            else:
-                inline_config['title'] = getattr(inline, 'verbose_name', inline.model.__name__)
-            inlines.append(inline_config)
+        # 只在列表页面添加内联配置，内联配置在初始化后不再变化，首次使用时生成
+        if self._list_inlines is None:
+            inlines = []
+            for inline in self._inline_instances:
+                inline_config = inline.get_formset()
+                # 从 Meta 类或模型名称获取标题
+                if hasattr(inline.model, 'Meta') and hasattr(inline.model.Meta, 'description'):
+                    inline_config['title'] = inline.model.Meta.description
+                else:
+                    inline_config['title'] = getattr(inline, 'verbose_name', inline.model.__name__)
+                inlines.append(inline_config)
+            self._list_inlines = inlines
         
-        config["inlines"] = inlines
+        config["inlines"] = self._list_inlines
         
         return config
 
@@ -515,20 +1017,47 @@ class ModelAdmin:
             tuple[bool, str]: (是否成功, 消息)
         """
         try:
+            # 处理表单数据
+            processed_data = await self.process_form_data(data)
+            if (
+                processed_data.keys() <= self._direct_update_fields
+                and self._can_update_directly()
+            ):
+                # 没有 save 钩子且提交的都是普通数据库字段时，直接执行一条只包含提交字段的 UPDATE，
+                # 不需要先查询对象；其他情况（关系字段、非数据库属性等）仍按 setattr + save 处理
+                now = timezone.now()
+                for name in self._auto_now_fields:
+                    # 与 save() 一致，auto_now 字段总是更新为当前时间
+                    processed_data[name] = now
+                if not processed_data:
+                    exists = await self.model.filter(**{self._pk_attr: object_id}).exists()
+                    return (True, "更新成功") if exists else (False, "记录不存在")
+                affected = await self.model.filter(**{self._pk_attr: object_id}).update(**processed_data)
+                if not affected:
+                    return False, "记录不存在"
+                return True, "更新成功"
+
             obj = await self.get_object(object_id)
             if not obj:
                 return False, "记录不存在"
-            # 处理表单数据
-            processed_data = await self.process_form_data(data)
             # 更新对象
             for field, value in processed_data.items():
                 setattr(obj, field, value)
             await obj.save()
             return True, "更新成功"
         except Exception as e:
-            print(f"Edit error: {str(e)}")
+            logger.error("Edit error: %s", e)
             return False, f"更新失败: {str(e)}"
 
+    def _can_update_directly(self) -> bool:
+        """模型没有重写 save、也没有注册保存信号时，编辑可以直接用 UPDATE 语句完成，添加可以用 bulk_create"""
+        if self.model.save is not Model.save:
+            return False
+        listeners = self.model._listeners
+        return not any(
+            listeners[signal].get(self.model) for signal in (Signals.pre_save, Signals.post_save)
+        )
+
     async def handle_add(self, request: Request, data: dict) -> tuple[bool, str]:
         """
         处理添加操作的钩子方法
@@ -546,9 +1075,47 @@ class ModelAdmin:
             return True, "创建成功"
             
         except Exception as e:
-            print(f"Add error: {str(e)}")
+            logger.error("Add error: %s", e)
             return False, f"创建失败: {str(e)}"
 
+    async def handle_bulk_add(self, request: Request, rows: List[dict]) -> tuple[bool, str, int]:
+        """
+        处理批量添加操作的钩子方法，所有记录在一个事务中以多行 INSERT 写入；
+        自定义了 handle_add 时逐条调用 handle_add，模型有保存钩子时逐条 create，任一条失败则整体回滚
+
+        Args:
+            request: Request对象
+            rows: 添加的数据列表，每项与 handle_add 的 data 相同
+
+        Returns:
+            tuple[bool, str, int]: (是否成功, 消息, 添加数量)
+        """
+        try:
+            if not rows:
+                return False, "没有可添加的记录", 0
+            if type(self).handle_add is not ModelAdmin.handle_add:
+                # 调用单条记录的添加方法，保证自定义校验和副作用不被绕过；事务连接只能依次使用
+                async with in_transaction():
+                    for index, row in enumerate(rows, 1):
+                        success, message = await self.handle_add(request, row)
+                        if not success:
+                            raise ValueError(f"第 {index} 条记录: {message}")
+                return True, f"成功添加 {len(rows)} 条记录", len(rows)
+
+            objs = [self.model(**await self.process_form_data(row)) for row in rows]
+            if not self._can_update_directly():
+                # bulk_create 不会调用 save 和保存信号，有保存钩子时逐条保存
+                async with in_transaction():
+                    for obj in objs:
+                        await obj.save()
+                return True, f"成功添加 {len(objs)} 条记录", len(objs)
+            async with in_transaction():
+                await self.model.bulk_create(objs, batch_size=self.bulk_create_batch_size)
+            return True, f"成功添加 {len(objs)} 条记录", len(objs)
+        except Exception as e:
+            logger.error("Bulk add error: %s", e)
+            return False, f"批量添加失败: {str(e)}", 0
+
     async def handle_delete(self, request: Request, object_id: str) -> tuple[bool, str]:
         """
         处理删除操作的钩子方法 
@@ -567,7 +1134,7 @@ class ModelAdmin:
             await obj.delete()
             return True, "删除成功"
         except Exception as e:
-            print(f"Delete error: {str(e)}")
+            logger.error("Delete error: %s", e)
             return False, f"删除失败: {str(e)}"
 
     async def handle_batch_delete(self, request: Request, ids: list) -> tuple[bool, str, int]:
@@ -576,32 +1143,102 @@ class ModelAdmin:
         
         Args:
             request: Request对象
-            ids: 要删除的记录ID列表
+            ids: 要删除的记录ID列表，路由已按主键字段类型转换（如整数主键为 int），
+                因此自定义 handle_delete 收到的 object_id 也是主键类型而不是字符串
             
         Returns:
             tuple[bool, str, int]: (是否成功, ��息, 删除成功数量)
         """
         try:
-            deleted_count = 0
-            for id in ids:
-                try:
-                    obj = await self.get_object(id)
-                    if obj:
-                        # 调用单条记录的删除方法保持一致性
-                        success, _ = await self.handle_delete(request, id)
-                        if success:
-                            deleted_count += 1
-                except Exception as e:
-                    print(f"删除记录 {id} 失败: {str(e)}")
-                    continue
+            if type(self).handle_delete is ModelAdmin.handle_delete:
+                # 未自定义单条删除逻辑时，用 DELETE ... WHERE pk IN (...) 完成批量删除
+                chunk_size = self.batch_delete_chunk_size
+                deleted_count = 0
+                # 主键较多时分批删除，所有批次在同一事务中提交
+                async with in_transaction():
+                    for start in range(0, len(ids), chunk_size):
+                        deleted_count += await self.model.filter(
+                            pk__in=ids[start:start + chunk_size]
+                        ).delete()
+                if deleted_count > 0:
+                    return True, f"成功删除 {deleted_count} 条记录", deleted_count
+                return False, "没有记录被删除", 0
+
+            # 调用单条记录的删除方法保持一致性，并发执行但限制同时占用的连接数
+            semaphore = asyncio.Semaphore(self.batch_delete_concurrency)
+
+            async def delete_one(pk) -> bool:
+                async with semaphore:
+                    try:
+                        success, _ = await self.handle_delete(request, pk)
+                        return success
+                    except Exception as e:
+                        logger.error("删除记录 %s 失败: %s", pk, e)
+                        return False
+
+            if self.batch_delete_atomic:
+                # 事务连接不能被多个协程同时使用，只能依次执行
+                async with in_transaction():
+                    results = [await delete_one(pk) for pk in ids]
+            else:
+                results = await asyncio.gather(*(delete_one(pk) for pk in ids))
+            deleted_count = sum(results)
                 
             if deleted_count > 0:
                 return True, f"成功删除 {deleted_count} 条记录", deleted_count
             return False, "没有记录被删除", 0
         except Exception as e:
-            print(f"Batch delete error: {str(e)}")
+            logger.error("Batch delete error: %s", e)
             return False, f"批量删除失败: {str(e)}", 0
 
+    async def get_count(self, queryset: QuerySet, params: dict) -> int:
+        """获取记录总数，设置 count_cache_ttl 后相同过滤条件在该时间内复用上次结果
+
+        缓存只在本后台写入数据时失效，外部写入最多滞后 count_cache_ttl 秒；
+        请求参数 exact_count=1 时跳过缓存和估算，重新执行 COUNT 查询
+        """
+        exact = params.get('exact_count') in ('1', 'true')
+        key = tuple(sorted(
+            (k, str(v)) for k, v in params.items() if k not in _PAGING_PARAMS and v
+        ))
+        if not key and not exact and self.estimate_count and self._is_postgres():
+            estimate = await self._estimate_count()
+            if estimate is not None:
+                return estimate
+        if not self.count_cache_ttl:
+            return await queryset.count()
+        now = time.monotonic()
+        cached = self._count_cache.get(key)
+        if cached and not exact and now - cached[0] < self.count_cache_ttl:
+            return cached[1]
+        total = await queryset.count()
+        if len(self._count_cache) >= _COUNT_CACHE_SIZE:
+            self._count_cache.clear()
+        self._count_cache[key] = (now, total)
+        return total
+
+    async def _estimate_count(self) -> Optional[int]:
+        """从 PostgreSQL 统计信息读取表的估算行数，表未分析过时返回 None"""
+        db = self.model._meta.db
+        # asyncpg 使用 $1 占位符，psycopg 使用 %s
+        placeholder = "%s" if "psycopg" in type(db).__module__ else "$1"
+        try:
+            rows = await db.execute_query_dict(
+                "SELECT reltuples::bigint AS estimate FROM pg_class "
+                f"WHERE oid = to_regclass({placeholder})",
+                [self.model._meta.db_table]
+            )
+        except Exception as e:
+            logger.warning("Count estimate failed for %s: %s", self.model.__name__, e)
+            return None
+        if rows and rows[0]["estimate"] is not None and rows[0]["estimate"] >= 0:
+            return rows[0]["estimate"]
+        return None
+
+    def invalidate_count_cache(self):
+        """数据发生变化后清空总数缓存"""
+        self._count_cache.clear()
+
     async def handle_query(self, request: Request, params: dict) -> tuple[QuerySet, int]:
         """
         处理数据查询的钩子方法
@@ -620,22 +1257,132 @@ class ModelAdmin:
             tuple[QuerySet, int]: (查询结果集, 总记录数)
         """
         try:
-            # 获取基础查询集
-            queryset = await self.get_queryset(request, params)
-            
-            # 处理排序
-            if params.get('sort'):
-                order_by = f"{'-' if params['order'] == 'desc' else ''}{params['sort']}"
-                queryset = queryset.order_by(order_by)
-            elif self.default_ordering:
-                queryset = queryset.order_by(*self.default_ordering)
+            queryset = await self._get_ordered_queryset(request, params)
             # 获取总记录数
-            total = await queryset.count()
+            total = await self.get_count(queryset, params)
             # 分页
             queryset = queryset.offset(params['offset']).limit(params['limit'])
             return queryset, total
             
         except Exception as e:
-            print(f"Query error: {str(e)}")
+            logger.error("Query error: %s", e)
             return self.model.all(), 0
 
+    async def _get_ordered_queryset(self, request: Request, params: dict) -> QuerySet:
+        """获取过滤并排序后的查询集（未分页）"""
+        queryset = await self.get_queryset(request, params)
+        
+        # 处理排序，只接受排序计划中的列，未知列回退到默认排序
+        sort = params.get('sort')
+        order_by = self._sort_plan.get(sort) if sort else None
+        if order_by:
+            queryset = queryset.order_by(f"-{order_by}" if params.get('order') == 'desc' else order_by)
+        elif '_search_rank' in queryset._annotations:
+            # 全文搜索结果按相关度降序，相同相关度再按默认排序
+            queryset = queryset.order_by('-_search_rank', *self.default_ordering)
+        elif self.default_ordering:
+            queryset = queryset.order_by(*self.default_ordering)
+        return queryset
+
+    def _keyset_sort_field(self, params: dict) -> Optional[str]:
+        """游标分页使用的排序字段，只支持列表查询取出的模型字段"""
+        sort = params.get('sort')
+        if sort and sort != self._pk_attr and sort in self._select_columns:
+            return sort
+        return None
+
+    def decode_cursor(self, cursor: str, params: dict) -> Optional[tuple]:
+        """
+        解析 make_cursor 生成的游标，返回转换为字段类型的 (排序值, 主键)，第一页（空游标）返回 None
+
+        Raises:
+            ValueError, TypeError: 游标格式错误或被篡改（binascii.Error 是 ValueError 的子类）
+        """
+        if not cursor:
+            return None
+        values = orjson.loads(base64.urlsafe_b64decode(cursor))
+        if not isinstance(values, list) or len(values) != 2:
+            raise ValueError("cursor must be a 2-element list")
+        sort_value, last_pk = values
+        last_pk = self._fields_map[self._pk_attr].to_python_value(last_pk)
+        if last_pk is None:
+            raise ValueError("cursor primary key is empty")
+        sort_field = self._keyset_sort_field(params)
+        if sort_field:
+            sort_value = self._fields_map[sort_field].to_python_value(sort_value)
+        return sort_value, last_pk
+
+    def _apply_cursor(self, queryset: QuerySet, params: dict) -> QuerySet:
+        """按 (排序字段, 主键) 排序，并只保留游标之后的记录；params['cursor'] 是 decode_cursor 的结果"""
+        desc = params.get('order') == 'desc'
+        prefix = '-' if desc else ''
+        pk = self._pk_attr
+        sort_field = self._keyset_sort_field(params)
+        orderings = (sort_field, pk) if sort_field else (pk,)
+        queryset = queryset.order_by(*(prefix + name for name in orderings))
+        if not params['cursor']:
+            return queryset
+
+        sort_value, last_pk = params['cursor']
+        op = 'lt' if desc else 'gt'
+        if not sort_field:
+            return queryset.filter(**{f"{pk}__{op}": last_pk})
+        return queryset.filter(Q(
+            Q(**{f"{sort_field}__{op}": sort_value}),
+            Q(**{sort_field: sort_value, f"{pk}__{op}": last_pk}),
+            join_type=Q.OR
+        ))
+
+    def make_cursor(self, objects: list, params: dict) -> Optional[str]:
+        """根据本页最后一行生成下一页的游标，没有下一页时返回 None"""
+        if not objects or len(objects) < params['limit']:
+            return None
+        last = objects[-1]
+        get = dict.get if isinstance(last, dict) else getattr
+        sort_field = self._keyset_sort_field(params)
+        sort_value = get(last, sort_field, None) if sort_field else None
+        raw = orjson.dumps([sort_value, get(last, self._pk_attr, None)], default=str)
+        return base64.urlsafe_b64encode(raw).decode()
+
+    async def query_page(self, request: Request, params: dict) -> tuple[list, int]:
+        """
+        获取一页列表数据和总记录数
+
+        未自定义 handle_query 时，COUNT 与分页查询并发执行（需要连接池至少有两个连接才能真正重叠）
+
+        Returns:
+            tuple[list, int]: (当前页数据, 总记录数)
+        """
+        if type(self).handle_query is not ModelAdmin.handle_query:
+            queryset, total = await self.handle_query(request, params)
+            return await self.fetch_objects(queryset), total
+
+        try:
+            queryset = await self._get_ordered_queryset(request, params)
+            limit = params['limit']
+            if 'cursor' in params:
+                # 游标分页，COUNT 使用的查询集不带游标条件
+                page = self._apply_cursor(queryset, params).limit(limit)
+                total, objects = await asyncio.gather(
+                    self.get_count(queryset, params),
+                    self.fetch_objects(page)
+                )
+                return objects, total
+            if not params['offset']:
+                # 第一页多取一行：数据不足一页时总数就是行数，无需再执行 COUNT
+                objects = await self.fetch_objects(queryset.limit(limit + 1))
+                if len(objects) <= limit:
+                    return objects, len(objects)
+                total = await self.get_count(queryset, params)
+                return objects[:limit], total
+            # offset/limit 返回新的查询集，COUNT 使用的查询集不受影响
+            page = queryset.offset(params['offset']).limit(limit)
+            total, objects = await asyncio.gather(
+                self.get_count(queryset, params),
+                self.fetch_objects(page)
+            )
+            return objects, total
+        except Exception as e:
+            logger.error("Query error: %s", e)
+            return [], 0
+
@@ -5,8 +5,9 @@ from tortoise import Model
 import asyncio
 from .filters import FilterType
 from tortoise.expressions import Q
-from functools import reduce
-import operator
+import logging
+
+logger = logging.getLogger(__name__)
 
 class DisplayType(Enum):
     """显示类型枚举"""
@@ -90,32 +91,35 @@ class TableField:
             return ''
             
         # 如果是关联字段
-        if self.related_model and self.related_key and instance:
+        related_model = self.related_model
+        related_key = self.related_key
+        if related_model and related_key and instance:
             try:
                 # 获取外键值
-                fk_value = getattr(instance, self.related_key)
+                fk_value = getattr(instance, related_key)
                 if not fk_value:
                     return ''
                     
                 # 查询关联对象
-                related_obj = await self.related_model.get(id=fk_value)
+                related_obj = await related_model.get(id=fk_value)
                 if related_obj:
                     # 获取关联字段的值
                     related_value = getattr(related_obj, self.related_field)
                     return str(related_value) if related_value is not None else ''
                 return ''
             except Exception as e:
-                print(f"Error getting related value: {str(e)}")
+                logger.warning("Error getting related value: %s", e)
                 return ''
                 
         # 使用自定义格式化函数
-        if self.formatter:
+        formatter = self.formatter
+        if formatter:
             try:
-                if asyncio.iscoroutinefunction(self.formatter):
-                    return await self.formatter(value)
-                return self.formatter(value)
+                if asyncio.iscoroutinefunction(formatter):
+                    return await formatter(value)
+                return formatter(value)
             except Exception as e:
-                print(f"Error formatting value: {str(e)}")
+                logger.warning("Error formatting value: %s", e)
                 return str(value)
                 
         return str(value)
@@ -224,6 +228,12 @@ class SearchField:
             self.label = self.name.replace('_', ' ').title()
         if not self.placeholder:
             self.placeholder = f"{self.label}"
+        # 关联字段的查询键只依赖字段配置，创建时生成一次
+        self._related_lookup = None
+        if self.related_model and self.related_key:
+            prefix = self.related_model.__name__ + '_'
+            if self.name.startswith(prefix):
+                self._related_lookup = f"{self.name[len(prefix):]}__icontains"
             
     def to_dict(self) -> dict:
         data = {
@@ -242,15 +252,11 @@ class SearchField:
         if not search_value:
             return {}
         if self.related_model and self.related_key:
-            # 从字段名中解析要搜索的关联字段
-            model_name = self.related_model.__name__
-            if self.name.startswith(model_name + '_'):
-                # 获取实际要搜索的字段名
-                related_field = self.name[len(model_name + '_'):]
+            if self._related_lookup:
                 try:
                     # 先查询关联模型
                     related_objects = await self.related_model.filter(
-                        **{f"{related_field}__icontains": search_value}
+                        **{self._related_lookup: search_value}
                     )
                     if not related_objects:
                         return {"id": None}   
@@ -261,12 +267,12 @@ class SearchField:
                     ] 
                     if conditions:
                         # 返回组合的Q对象
-                        combined_q = reduce(operator.or_, conditions)
+                        combined_q = Q(*conditions, join_type=Q.OR)
                         return {"_q_object": combined_q}
                     return {"id": None}
                 except Exception as e:
-                    print(f"Error in related search: {str(e)}")
+                    logger.warning("Error in related search: %s", e)
                     return {"id": None}
         else:
             # 直接搜索当前字段，使用精确匹配而不是模糊匹配
-            return {f"{self.name}": search_value}
+            return {self.name: search_value}
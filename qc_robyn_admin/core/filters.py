@@ -3,8 +3,9 @@ from typing import Optional, Dict, Any, Type
 from dataclasses import dataclass
 from tortoise import Model
 from tortoise.expressions import Q
-import operator
-from functools import reduce
+import logging
+
+logger = logging.getLogger(__name__)
 
 class FilterType(Enum):
     """过滤器类型"""
@@ -32,6 +33,14 @@ class FilterField:
     def __post_init__(self):
         if self.label is None:
             self.label = self.name.replace('_', ' ').title()
+        # 查询条件的键只依赖字段配置，创建时生成一次
+        self._lookup = f"{self.name}__{self.operator}"
+        self._related_lookup = None
+        if self.related_model and self.related_key:
+            # 从字段名中解析要过滤的关联字段
+            prefix = self.related_model.__name__ + '_'
+            if self.name.startswith(prefix):
+                self._related_lookup = f"{self.name[len(prefix):]}__icontains"
             
     def to_dict(self) -> dict:
         """转换为字典，用于JSON序列化"""
@@ -58,15 +67,11 @@ class FilterField:
             return {}
             
         if self.related_model and self.related_key:
-            # 从字段名中解析要过滤的关联字段
-            model_name = self.related_model.__name__
-            if self.name.startswith(model_name + '_'):
-                # 获取实际要过滤的字段名
-                related_field = self.name[len(model_name + '_'):]
+            if self._related_lookup:
                 try:
                     # 先查询关联模型
                     related_objects = await self.related_model.filter(
-                        **{f"{related_field}__icontains": filter_value}
+                        **{self._related_lookup: filter_value}
                     )
                     if not related_objects:
                         return {"id": None}
@@ -79,16 +84,16 @@ class FilterField:
                     
                     if conditions:
                         # 返回组合的Q对象
-                        combined_q = reduce(operator.or_, conditions)
+                        combined_q = Q(*conditions, join_type=Q.OR)
                         return {"_q_object": combined_q}
                     return {"id": None}
                     
                 except Exception as e:
-                    print(f"Error in related filter: {str(e)}")
+                    logger.warning("Error in related filter: %s", e)
                     return {"id": None}
         else:
             # 直接过滤当前字段
-            return {f"{self.name}__{self.operator}": filter_value}
+            return {self._lookup: filter_value}
 
 class InputFilter(FilterField):
     """输入框过滤器"""
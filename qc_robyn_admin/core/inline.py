@@ -3,6 +3,9 @@ from tortoise import Model
 from .fields import TableField, FormField
 import asyncio
 from dataclasses import dataclass
+import logging
+
+logger = logging.getLogger(__name__)
 
 class InlineModelAdmin:
     """内联管理类基类"""
@@ -38,6 +41,29 @@ class InlineModelAdmin:
             self.default_ordering = []
         self.is_inline = True  # 设置为内联模型
 
+        # 预先整理字段元数据，序列化时直接遍历元组，不再逐行判断字段类型
+        # 普通字段: (字段名, formatter, formatter 是否为协程函数)
+        # 关联字段: (字段名, 关联模型, 外键字段, 关联模型中要显示的字段)
+        plain_fields = []
+        fk_fields = []
+        for field in self.table_fields:
+            if field.related_model and field.related_key:
+                fk_fields.append((
+                    field.name, field.related_model, field.related_key,
+                    field.name.split('_')[-1]  # 获取最后一部分作为字段名
+                ))
+            else:
+                plain_fields.append((
+                    field.name, field.formatter,
+                    asyncio.iscoroutinefunction(field.formatter)
+                ))
+        self._plain_fields = tuple(plain_fields)
+        self._fk_fields = tuple(fk_fields)
+        # 允许排序的字段名
+        self.sortable_field_names = frozenset(
+            field.name for field in self.table_fields if field.sortable
+        )
+
     async def get_queryset(self, parent_instance):
         """获取关联的查询集"""
         if not parent_instance:
@@ -77,43 +103,101 @@ class InlineModelAdmin:
             'ordering_fields': ordering_fields  # 使用从table_fields获取的可排序字段
         }
         
-    async def serialize_object(self, obj: Model, for_display: bool = True) -> dict:
-        """序列化对象"""
-        result = {'id': str(getattr(obj, 'id', ''))}
+    async def _get_related_value(self, obj: Model, fk_field: tuple) -> str:
+        """获取关联字段的显示值"""
+        name, related_model, related_key, related_field = fk_field
+        try:
+            # 处理关联字段
+            fk_value = getattr(obj, related_key)
+            if fk_value:
+                try:
+                    related_obj = await related_model.get(id=fk_value)
+                    if related_obj:
+                        # 获取关联字段的值
+                        related_value = getattr(related_obj, related_field)
+                        return str(related_value) if related_value is not None else ''
+                except Exception as e:
+                    logger.warning("Error getting related object: %s", e)
+            return ''
+        except Exception as e:
+            logger.warning("Error processing field %s: %s", name, e)
+            return ''
+
+    async def _prefetch_related_objects(self, objs: List[Model]) -> dict:
+        """按关联模型汇总一批对象的外键值，每个关联模型只查询一次，返回 {关联模型: {id: 对象}}"""
+        ids_by_model = {}
+        fields_by_model = {}
+        for _, related_model, related_key, related_field in self._fk_fields:
+            ids = ids_by_model.setdefault(related_model, set())
+            fields_by_model.setdefault(related_model, {'id'}).add(related_field)
+            for obj in objs:
+                fk_value = getattr(obj, related_key, None)
+                if fk_value:
+                    ids.add(fk_value)
+        models = [model for model, ids in ids_by_model.items() if ids]
+
+        def query(model):
+            queryset = model.filter(id__in=list(ids_by_model[model]))
+            columns = fields_by_model[model]
+            # 只取需要显示的字段；要显示的不是数据库字段（如 property）时查询完整对象
+            if columns <= model._meta.fields_db_projection.keys():
+                queryset = queryset.only(*columns)
+            return queryset
+
+        results = await asyncio.gather(*(query(model) for model in models))
+        related_objects = {model: {} for model in ids_by_model}
+        for model, rows in zip(models, results):
+            related_objects[model] = {obj.id: obj for obj in rows}
+        return related_objects
+
+    async def serialize_objects(self, objs: List[Model], for_display: bool = True) -> List[dict]:
+        """批量序列化，关联字段批量查询；序列化失败的对象记录日志后跳过"""
+        related_objects = await self._prefetch_related_objects(objs) if self._fk_fields and objs else {}
+        results = []
+        for obj in objs:
+            try:
+                results.append(await self.serialize_object(obj, for_display, related_objects))
+            except Exception as e:
+                logger.exception("Error serializing object: %s", e)
+        return results
+
+    async def serialize_object(
+        self, obj: Model, for_display: bool = True, related_objects: Optional[dict] = None
+    ) -> dict:
+        """序列化对象，related_objects 为 _prefetch_related_objects 批量查询的关联对象"""
+        pk = obj.pk
+        result = {'id': '' if pk is None else str(pk)}
         
-        for field in self.table_fields:
+        if related_objects is not None:
+            for name, related_model, related_key, related_field in self._fk_fields:
+                related_obj = related_objects.get(related_model, {}).get(getattr(obj, related_key, None))
+                related_value = getattr(related_obj, related_field, None) if related_obj else None
+                result[name] = str(related_value) if related_value is not None else ''
+        # 多个关联字段的查询并发执行
+        elif self._fk_fields:
+            related_values = await asyncio.gather(
+                *(self._get_related_value(obj, fk_field) for fk_field in self._fk_fields)
+            )
+            for (name, *_), value in zip(self._fk_fields, related_values):
+                result[name] = value
+
+        for name, formatter, is_coro in self._plain_fields:
             try:
-                if field.related_model and field.related_key:
-                    # 处理关联字段
-                    fk_value = getattr(obj, field.related_key)
-                    if fk_value:
-                        try:
-                            related_obj = await field.related_model.get(id=fk_value)
-                            if related_obj:
-                                # 获取关联字段的值
-                                related_field = field.name.split('_')[-1]  # 获取最后一部分作为字段名
-                                related_value = getattr(related_obj, related_field)
-                                result[field.name] = str(related_value) if related_value is not None else ''
-                                continue
-                        except Exception as e:
-                            print(f"Error getting related object: {str(e)}")
-                    result[field.name] = ''
+                # 处理普通字段
+                value = getattr(obj, name, None)
+                if for_display and formatter and value is not None:
+                    try:
+                        if is_coro:
+                            result[name] = await formatter(value)
+                        else:
+                            result[name] = formatter(value)
+                    except Exception as e:
+                        logger.warning("Error formatting field %s: %s", name, e)
+                        result[name] = str(value)
                 else:
-                    # 处理普通字段
-                    value = getattr(obj, field.name, None)
-                    if for_display and field.formatter and value is not None:
-                        try:
-                            if asyncio.iscoroutinefunction(field.formatter):
-                                result[field.name] = await field.formatter(value)
-                            else:
-                                result[field.name] = field.formatter(value)
-                        except Exception as e:
-                            print(f"Error formatting field {field.name}: {str(e)}")
-                            result[field.name] = str(value) if value is not None else ''
-                    else:
-                        result[field.name] = str(value) if value is not None else ''
+                    result[name] = str(value) if value is not None else ''
             except Exception as e:
-                print(f"Error processing field {field.name}: {str(e)}")
-                result[field.name] = ''
+                logger.warning("Error processing field %s: %s", name, e)
+                result[name] = ''
         
-        return result
\ No newline at end of file
+        return result
@@ -3,6 +3,9 @@ from tortoise.signals import post_save
 from typing import Type, Optional, List
 import hashlib
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 class AdminUser(models.Model):
     """后台管理用户模型"""
@@ -78,7 +81,7 @@ class AdminUser(models.Model):
                         is_superuser=True
                     )
             except Exception as e:
-                print(f"Error creating admin user: {str(e)}")
+                logger.error("Error creating admin user: %s", e)
 
 # 注册信号
 post_save(AdminUser)(AdminUser.ensure_admin_exists)
\ No newline at end of file
@@ -0,0 +1,11 @@
+import pytest_asyncio
+from tortoise import Tortoise
+
+
+@pytest_asyncio.fixture
+async def db():
+    """每个测试使用独立的内存 SQLite 数据库"""
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["tests.models"]})
+    await Tortoise.generate_schemas()
+    yield
+    await Tortoise.close_connections()
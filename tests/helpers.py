@@ -0,0 +1,25 @@
+from types import SimpleNamespace
+
+from robyn import Robyn
+
+from qc_robyn_admin.core.site import AdminSite
+
+
+def make_site(model, admin_class):
+    """创建注册了指定模型的站点，当前用户固定为超级用户"""
+    site = AdminSite(Robyn(__file__), db_url="sqlite://:memory:")
+    site.register_model(model, admin_class)
+
+    async def current_user(request):
+        return SimpleNamespace(is_superuser=True)
+
+    site._get_current_user = current_user
+    return site, site.models[admin_class.__name__]
+
+
+def route_handler(site, path):
+    """按路由路径取出注册的处理函数"""
+    return next(
+        route.function.handler for route in site.app.router.get_routes()
+        if route.route == path
+    )
@@ -0,0 +1,43 @@
+from tortoise import fields
+from tortoise.contrib.postgres.fields import TSVectorField
+from tortoise.models import Model
+
+
+class Article(Model):
+    """测试用模型：包含 auto_now 字段和一个非数据库属性"""
+    id = fields.IntField(primary_key=True)
+    title = fields.CharField(max_length=100)
+    views = fields.IntField(default=0)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    @property
+    def code(self):
+        return f"T{self.id}"
+
+    @property
+    def headline(self):
+        return self.title.upper()
+
+    @headline.setter
+    def headline(self, value):
+        self.title = value.lower()
+
+
+class Note(Model):
+    """测试用模型：用于注册保存信号"""
+    id = fields.IntField(primary_key=True)
+    content = fields.CharField(max_length=100)
+
+
+class Comment(Model):
+    """测试用模型：为 Article 提供反向外键关系"""
+    id = fields.IntField(primary_key=True)
+    article = fields.ForeignKeyField("models.Article", related_name="comments")
+    body = fields.CharField(max_length=100)
+
+
+class Document(Model):
+    """测试用模型：包含全文搜索使用的 tsvector 字段"""
+    id = fields.IntField(primary_key=True)
+    title = fields.CharField(max_length=100)
+    search_tsv = TSVectorField(stored=False, null=True)
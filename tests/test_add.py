@@ -0,0 +1,69 @@
+from tortoise.signals import post_save
+
+from qc_robyn_admin.core.admin import ModelAdmin
+from tests.models import Article, Note
+
+
+class ArticleAdmin(ModelAdmin):
+    pass
+
+
+class ValidatingArticleAdmin(ModelAdmin):
+    async def handle_add(self, request, data):
+        self.added.append(data["title"])
+        if data["title"] == "bad":
+            return False, "标题无效"
+        return await super().handle_add(request, data)
+
+
+class NoteAdmin(ModelAdmin):
+    pass
+
+
+async def test_bulk_add(db):
+    admin = ArticleAdmin(Article)
+    ok, msg, count = await admin.handle_bulk_add(None, [{"title": "a"}, {"title": "b"}])
+    assert ok, msg
+    assert count == 2
+    assert sorted(await Article.all().values_list("title", flat=True)) == ["a", "b"]
+
+
+async def test_bulk_add_uses_overridden_handle_add(db):
+    admin = ValidatingArticleAdmin(Article)
+    admin.added = []
+
+    ok, msg, count = await admin.handle_bulk_add(None, [{"title": "a"}, {"title": "b"}])
+
+    assert ok, msg
+    assert count == 2
+    assert admin.added == ["a", "b"]
+    assert await Article.all().count() == 2
+
+
+async def test_bulk_add_rolls_back_when_handle_add_fails(db):
+    admin = ValidatingArticleAdmin(Article)
+    admin.added = []
+
+    ok, msg, count = await admin.handle_bulk_add(None, [{"title": "a"}, {"title": "bad"}])
+
+    assert not ok
+    assert "标题无效" in msg
+    assert count == 0
+    assert await Article.all().count() == 0
+
+
+async def test_bulk_add_fires_save_signals(db):
+    saved = []
+
+    @post_save(Note)
+    async def on_post_save(sender, instance, created, using_db, update_fields):
+        saved.append(instance.content)
+
+    try:
+        admin = NoteAdmin(Note)
+        ok, msg, count = await admin.handle_bulk_add(None, [{"content": "a"}, {"content": "b"}])
+        assert ok, msg
+        assert saved == ["a", "b"]
+    finally:
+        for signal in Note._listeners.values():
+            signal.pop(Note, None)
@@ -0,0 +1,22 @@
+from qc_robyn_admin.core.admin import ModelAdmin
+from qc_robyn_admin.core.fields import TableField
+from tests.models import Article
+
+
+class FilterArticleAdmin(ModelAdmin):
+    table_fields = [TableField("id"), TableField("title", filterable=True)]
+
+
+async def test_processed_fields_are_not_shared_between_instances(db):
+    first = FilterArticleAdmin(Article)
+    second = FilterArticleAdmin(Article)
+
+    first.list_display.append("views")
+    first._filter_choices["title"].append(("x", "x"))
+    first.table_field_map.pop("title")
+
+    third = FilterArticleAdmin(Article)
+    for admin in (second, third):
+        assert admin.list_display == ["id", "title"]
+        assert ("x", "x") not in admin._filter_choices["title"]
+        assert "title" in admin.table_field_map
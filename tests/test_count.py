@@ -0,0 +1,45 @@
+from qc_robyn_admin.core.admin import ModelAdmin
+from tests.models import Article
+
+
+class ArticleAdmin(ModelAdmin):
+    pass
+
+
+class CachedArticleAdmin(ModelAdmin):
+    count_cache_ttl = 60
+
+
+async def test_count_not_cached_by_default(db):
+    admin = ArticleAdmin(Article)
+    await Article.create(title="a")
+    assert await admin.get_count(Article.all(), {}) == 1
+
+    await Article.create(title="b")
+    assert await admin.get_count(Article.all(), {}) == 2
+
+
+async def test_count_cache_invalidation(db):
+    admin = CachedArticleAdmin(Article)
+    await Article.create(title="a")
+    assert await admin.get_count(Article.all(), {}) == 1
+
+    # 外部写入在缓存时间内不可见
+    await Article.create(title="b")
+    assert await admin.get_count(Article.all(), {}) == 1
+    # exact_count 跳过缓存并刷新缓存值
+    assert await admin.get_count(Article.all(), {"exact_count": "1"}) == 2
+    assert await admin.get_count(Article.all(), {}) == 2
+
+    await Article.create(title="c")
+    admin.invalidate_count_cache()
+    assert await admin.get_count(Article.all(), {}) == 3
+
+
+async def test_count_cache_keyed_by_filters(db):
+    admin = CachedArticleAdmin(Article)
+    await Article.create(title="a")
+    await Article.create(title="b")
+
+    assert await admin.get_count(Article.filter(title="a"), {"title": "a"}) == 1
+    assert await admin.get_count(Article.all(), {}) == 2
@@ -0,0 +1,49 @@
+import base64
+from types import SimpleNamespace
+
+import orjson
+
+from qc_robyn_admin.core.admin import ModelAdmin
+from tests.helpers import make_site, route_handler
+from tests.models import Article
+
+
+class ArticleAdmin(ModelAdmin):
+    pass
+
+
+def data_request(admin, **query):
+    query_params = SimpleNamespace(to_dict=lambda: {key: [value] for key, value in query.items()})
+    return SimpleNamespace(
+        path_params={"route_id": admin.route_id}, query_params=query_params, headers={}
+    )
+
+
+def encode(value):
+    return base64.urlsafe_b64encode(orjson.dumps(value)).decode()
+
+
+async def test_cursor_pagination(db):
+    for i in range(3):
+        await Article.create(title=str(i))
+    site, admin = make_site(Article, ArticleAdmin)
+    handler = route_handler(site, "/admin/:route_id/data")
+
+    first = orjson.loads((await handler(data_request(admin, limit="2", cursor=""))).description)
+    assert [row["data"]["title"] for row in first["data"]] == ["0", "1"]
+
+    second = orjson.loads(
+        (await handler(data_request(admin, limit="2", cursor=first["next_cursor"]))).description
+    )
+    assert [row["data"]["title"] for row in second["data"]] == ["2"]
+    assert second["next_cursor"] is None
+
+
+async def test_invalid_cursor_is_rejected(db):
+    await Article.create(title="a")
+    site, admin = make_site(Article, ArticleAdmin)
+    handler = route_handler(site, "/admin/:route_id/data")
+
+    for cursor in ("not base64!", encode({"a": 1}), encode([1]), encode([None, "abc"]), encode([None, None])):
+        response = await handler(data_request(admin, cursor=cursor))
+        assert response.status_code == 400, cursor
@@ -0,0 +1,94 @@
+import asyncio
+from types import SimpleNamespace
+from urllib.parse import urlencode
+
+import orjson
+
+from qc_robyn_admin.core.admin import ModelAdmin
+from tests.helpers import make_site, route_handler
+from tests.models import Article
+
+
+class ArticleAdmin(ModelAdmin):
+    batch_delete_chunk_size = 2
+
+
+class CustomDeleteArticleAdmin(ModelAdmin):
+    async def handle_delete(self, request, object_id):
+        self.received.append(object_id)
+        return await super().handle_delete(request, object_id)
+
+
+def make_batch_delete_site(admin_class):
+    site, admin = make_site(Article, admin_class)
+    return site, admin, route_handler(site, "/admin/:route_id/batch_delete")
+
+
+def batch_delete_request(admin, ids, **extra):
+    body = urlencode([("ids[]", pk) for pk in ids] + list(extra.items()))
+    return SimpleNamespace(body=body, path_params={"route_id": admin.route_id}, headers={})
+
+
+async def test_batch_delete_in_chunks(db):
+    articles = [await Article.create(title=str(i)) for i in range(5)]
+    admin = ArticleAdmin(Article)
+
+    ok, msg, count = await admin.handle_batch_delete(None, [a.id for a in articles[:3]] + [999])
+
+    assert ok, msg
+    assert count == 3
+    assert await Article.all().count() == 2
+
+
+async def test_batch_delete_nothing_deleted(db):
+    admin = ArticleAdmin(Article)
+    ok, msg, count = await admin.handle_batch_delete(None, [999])
+    assert not ok
+    assert count == 0
+
+
+async def test_batch_delete_custom_handle_delete_gets_typed_pks(db):
+    articles = [await Article.create(title=str(i)) for i in range(3)]
+    site, admin, handler = make_batch_delete_site(CustomDeleteArticleAdmin)
+    admin.received = []
+
+    response = await handler(batch_delete_request(admin, [str(a.id) for a in articles[:2]]))
+
+    payload = orjson.loads(response.description)
+    assert payload["success"]
+    assert payload["data"]["deleted_count"] == 2
+    assert sorted(admin.received) == [articles[0].id, articles[1].id]
+    assert await Article.all().count() == 1
+
+
+async def test_batch_delete_route_rejects_invalid_ids(db):
+    site, admin, handler = make_batch_delete_site(ArticleAdmin)
+    response = await handler(batch_delete_request(admin, ["abc"]))
+    assert response.status_code == 400
+
+
+async def test_batch_delete_route_invalidates_count_cache(db):
+    articles = [await Article.create(title=str(i)) for i in range(3)]
+    site, admin, handler = make_batch_delete_site(ArticleAdmin)
+    admin.count_cache_ttl = 60
+    assert await admin.get_count(Article.all(), {}) == 3
+
+    await handler(batch_delete_request(admin, [str(articles[0].id)]))
+
+    assert await admin.get_count(Article.all(), {}) == 2
+
+
+async def test_background_batch_delete(db):
+    articles = [await Article.create(title=str(i)) for i in range(3)]
+    site, admin, handler = make_batch_delete_site(ArticleAdmin)
+
+    response = await handler(
+        batch_delete_request(admin, [str(a.id) for a in articles], background="1")
+    )
+
+    assert response.status_code == 202
+    payload = orjson.loads(response.description)
+    assert payload["data"]["scheduled_count"] == 3
+    await asyncio.gather(*site._background_tasks)
+    assert await Article.all().count() == 0
+    assert not site._background_tasks
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from tortoise import timezone
+from tortoise.signals import post_save, pre_save
+
+from qc_robyn_admin.core.admin import ModelAdmin
+from tests.models import Article, Note
+
+
+class ArticleAdmin(ModelAdmin):
+    pass
+
+
+class NoteAdmin(ModelAdmin):
+    pass
+
+
+async def test_edit_updates_directly_without_listeners(db):
+    admin = ArticleAdmin(Article)
+    assert admin._can_update_directly()
+    article = await Article.create(title="old", views=1)
+    stale = timezone.now() - timedelta(days=3)
+
+    ok, msg = await admin.handle_edit(None, str(article.id), {"title": "new", "updated_at": stale})
+
+    assert ok, msg
+    await article.refresh_from_db()
+    assert article.title == "new"
+    assert article.views == 1
+    # 与 save() 一致，提交的 auto_now 值会被当前时间覆盖
+    assert article.updated_at > stale + timedelta(days=1)
+
+
+async def test_edit_missing_record(db):
+    admin = ArticleAdmin(Article)
+    ok, msg = await admin.handle_edit(None, "999", {"title": "new"})
+    assert not ok
+    assert msg == "记录不存在"
+
+
+async def test_edit_with_save_listeners_uses_save(db):
+    calls = []
+
+    @pre_save(Note)
+    async def on_pre_save(sender, instance, using_db, update_fields):
+        calls.append(("pre", instance.content))
+
+    @post_save(Note)
+    async def on_post_save(sender, instance, created, using_db, update_fields):
+        calls.append(("post", instance.content))
+
+    try:
+        admin = NoteAdmin(Note)
+        assert not admin._can_update_directly()
+        note = await Note.create(content="old")
+        calls.clear()
+
+        ok, msg = await admin.handle_edit(None, str(note.id), {"content": "new"})
+
+        assert ok, msg
+        assert calls == [("pre", "new"), ("post", "new")]
+        await note.refresh_from_db()
+        assert note.content == "new"
+    finally:
+        for signal in Note._listeners.values():
+            signal.pop(Note, None)
+
+
+async def test_edit_non_column_key_falls_back_to_save(db):
+    admin = ArticleAdmin(Article)
+    # 表单里包含一个非数据库属性，只能通过 setattr + save 处理
+    admin.add_form_field_map = {**admin.add_form_field_map, "headline": admin.add_form_field_map["title"]}
+    article = await Article.create(title="old")
+
+    ok, msg = await admin.handle_edit(None, str(article.id), {"headline": "NEW"})
+
+    assert ok, msg
+    await article.refresh_from_db()
+    assert article.title == "new"
@@ -0,0 +1,76 @@
+from qc_robyn_admin.core.admin import ModelAdmin
+from qc_robyn_admin.core.fields import TableField
+from tests.models import Article, Comment
+
+
+class ColumnArticleAdmin(ModelAdmin):
+    table_fields = [TableField("id"), TableField("title")]
+
+
+class PropertyArticleAdmin(ModelAdmin):
+    table_fields = [TableField("id"), TableField("code"), TableField("headline")]
+
+
+async def test_column_only_list_uses_values(db):
+    await Article.create(title="first")
+    admin = ColumnArticleAdmin(Article)
+    assert not admin._fetch_instances
+
+    objects, total = await admin.query_page(None, {"limit": 10, "offset": 0})
+    rows = await admin.serialize_page(objects)
+
+    assert total == 1
+    assert isinstance(objects[0], dict)
+    assert rows[0]["data"]["title"] == "first"
+
+
+async def test_list_serializes_property_fields(db):
+    article = await Article.create(title="first")
+    admin = PropertyArticleAdmin(Article)
+    assert admin._fetch_instances
+
+    objects, total = await admin.query_page(None, {"limit": 10, "offset": 0})
+    rows = await admin.serialize_page(objects)
+
+    assert total == 1
+    # 属性依赖未显示的 title 列，也能取到正确的值
+    assert rows[0]["data"]["code"] == f"T{article.id}"
+    assert rows[0]["data"]["headline"] == "FIRST"
+
+
+class DefaultArticleAdmin(ModelAdmin):
+    pass
+
+
+class CommentCountArticleAdmin(ModelAdmin):
+    table_fields = [
+        TableField("id"),
+        TableField("comments", formatter=lambda comments: str(len(comments))),
+    ]
+
+
+async def test_default_list_does_not_prefetch_reverse_relations(db):
+    await Article.create(title="first")
+    admin = DefaultArticleAdmin(Article)
+    # 默认字段包含反向关系 comments，但没有 formatter 时不预取，仍使用 values()
+    assert "comments" in admin._plain_field_names
+    assert admin._prefetch_related == ()
+    assert not admin._fetch_instances
+
+    objects, total = await admin.query_page(None, {"limit": 10, "offset": 0})
+
+    assert total == 1
+    assert isinstance(objects[0], dict)
+
+
+async def test_reverse_relation_with_formatter_is_prefetched(db):
+    article = await Article.create(title="first")
+    await Comment.create(article=article, body="a")
+    await Comment.create(article=article, body="b")
+    admin = CommentCountArticleAdmin(Article)
+    assert admin._prefetch_related == ("comments",)
+
+    objects, _ = await admin.query_page(None, {"limit": 10, "offset": 0})
+    rows = await admin.serialize_page(objects)
+
+    assert rows[0]["display"]["comments"] == "2"
@@ -0,0 +1,38 @@
+import pytest
+
+from qc_robyn_admin.core.admin import ModelAdmin
+from tests.models import Document
+
+
+class DocumentAdmin(ModelAdmin):
+    search_vector_field = "search_tsv"
+    default_ordering = ["id"]
+
+
+class PlainTextDocumentAdmin(ModelAdmin):
+    search_vector_field = "title"
+
+
+async def test_search_vector_field_must_be_tsvector(db):
+    with pytest.raises(ValueError):
+        PlainTextDocumentAdmin(Document)
+
+
+async def test_vector_search_orders_by_rank(db):
+    admin = DocumentAdmin(Document)
+    admin._is_postgres = lambda: True
+
+    queryset = await admin._get_ordered_queryset(None, {"search": "robyn", "sort": ""})
+    sql = queryset.sql()
+
+    assert "TS_RANK" in sql
+    assert 'ORDER BY "_search_rank" DESC,"id" ASC' in sql
+
+
+async def test_vector_search_respects_explicit_sort(db):
+    admin = DocumentAdmin(Document)
+    admin._is_postgres = lambda: True
+
+    queryset = await admin._get_ordered_queryset(None, {"search": "robyn", "sort": "title"})
+
+    assert '"_search_rank" DESC' not in queryset.sql()
@@ -0,0 +1,13 @@
+from robyn import Robyn
+
+from qc_robyn_admin.core.site import AdminSite
+
+
+def test_sites_do_not_share_template_environment():
+    first = AdminSite(Robyn(__file__), db_url="sqlite://:memory:")
+    second = AdminSite(Robyn(__file__), db_url="sqlite://:memory:")
+
+    assert first.jinja_template is not second.jinja_template
+    first.jinja_template.env.globals["brand"] = "first"
+    assert "brand" not in second.jinja_template.env.globals
+    assert second.jinja_template.env.globals["get_text"].__self__ is second